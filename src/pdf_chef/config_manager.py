@@ -1,18 +1,28 @@
 """Module for loading the configuration files."""
 
+import os
 import yaml
 
 from pathlib import Path
 from pydantic import BaseModel, ConfigDict, field_validator
-from typing import Tuple
+from typing import ClassVar, Tuple
 
 from pdf_chef.utils.utils_colors import normalize_rgb
 
+# Prefer the libyaml-backed loader when PyYAML was built with it; it parses the
+# same safe subset of YAML considerably faster than the pure-Python loader.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 class StrictModel(BaseModel):
-    """Base model that forbids undeclared configuration fields."""
+    """Base model that forbids undeclared fields and is immutable once
+    validated, so a cached configuration can be shared safely.
+    """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class Config(StrictModel):
@@ -192,7 +202,16 @@ class Config(StrictModel):
 
 
 class ConfigManager:
-    """Load and validate YAML configuration files into Config objects."""
+    """Load and validate YAML configuration files into Config objects.
+
+    Validated configurations are cached per path together with the file's
+    modification time, so repeated loads of an unchanged file skip parsing and
+    validation. Only the latest version of each file is kept. The returned
+    Config is frozen and shared between callers; use ``model_copy`` to derive
+    a changed configuration.
+    """
+
+    _cache: ClassVar[dict[str, tuple[float, Config]]] = {}
 
     def load_config_file(self, path: str | Path) -> Config:
         """Load and validate a YAML config file.
@@ -203,7 +222,21 @@ class ConfigManager:
         Returns:
             Config: The validated configuration object.
         """
+        cache_key = os.fspath(path)
+        mtime = os.stat(path).st_mtime
+        cached = self._cache.get(cache_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
         with open(path, "r", encoding="utf-8") as f:
-            raw_config = yaml.safe_load(f)
+            raw_config = yaml.load(f, Loader=_YamlLoader)
+
+        config = Config.model_validate(raw_config)
+        self._cache[cache_key] = (mtime, config)
+        return config
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Remove all cached configurations."""
 
-        return Config(**raw_config)
+        cls._cache.clear()
@@ -4,3 +4,10 @@
 # Kept below the PDF spec limit of 14400 points (~5080 mm) so the intermediate
 # document stays valid; the final page is cropped down to fit the content
 WORKING_PAGE_HEIGHT_MM: int = 5000  # Units: mm.
+
+# Maximum number of wrapped text blocks remembered per PageBuilder. Bounds the
+# memory used by the wrap cache for documents with many distinct text blocks
+TEXT_BLOCK_CACHE_SIZE: int = 1024
+
+# Maximum number of (font, size, word) widths remembered per PageBuilder
+WORD_WIDTH_CACHE_SIZE: int = 4096
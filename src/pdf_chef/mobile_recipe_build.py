@@ -21,23 +21,25 @@ class RecipePDFBuilder:
     def __init__(self, config: Config) -> None:
         """Initialize a RecipePDFBuilder for mobile-optimized recipe PDFs.
 
-        Sets up the page builder and recipe renderer from the configuration and
-        loads the recipe JSON files into memory.
+        Loads the recipe JSON files into memory, then sets up the page builder
+        and recipe renderer from the configuration. Recipes are loaded first
+        so a missing or malformed recipe fails before any PDF canvas or output
+        directory is created.
 
         Args:
             config (Config): Validated configuration controlling page layout,
                 margins, fonts, and colors.
         """
         self.config = config
-        self.page = PageBuilder(config=self.config)
-        self.renderer = RecipeRenderer(config=self.config, page=self.page)
-        self.y_position = self.page.page_height
         self.recipes = [
             load_json_file(file_path=path)
             for path in sorted(
                 Path(self.config.io.input_recipe_directory).glob("*.json")
             )
         ]
+        self.page = PageBuilder(config=self.config)
+        self.renderer = RecipeRenderer(config=self.config, page=self.page)
+        self.y_position = self.page.page_height
 
     def _draw_toc(self) -> None:
         """Draw the table of contents page.
@@ -1,17 +1,42 @@
 """Module for creating PDF documents using the ReportLab package."""
 
+import io
+
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Tuple
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
 from reportlab.lib.utils import ImageReader
 from pypdf import PdfReader, PdfWriter
 
 from pdf_chef.config_manager import Config
-from pdf_chef.constants import WORKING_PAGE_HEIGHT_MM
-from pdf_chef.text_segment import TextSegment
+from pdf_chef.constants import (
+    TEXT_BLOCK_CACHE_SIZE,
+    WORD_WIDTH_CACHE_SIZE,
+    WORKING_PAGE_HEIGHT_MM,
+)
+from pdf_chef.text_segment import PreparedText, TextSegment, WrappedSegment
 from pdf_chef.utils.utils_file_system import ensure_directory
 
 
+@lru_cache(maxsize=64)
+def _image_size(image_path: str) -> tuple[int, int]:
+    """Read the pixel size of an image file once per path.
+
+    Only the size is kept; the image itself is embedded by ``drawImage`` from
+    its path, which copies JPEG data without decoding it.
+
+    Args:
+        image_path (str): Path to the image file.
+
+    Returns:
+        tuple[int, int]: The image width and height in pixels.
+    """
+    return ImageReader(image_path).getSize()
+
+
 class PageBuilder:
     """Build simple PDFs with custom page sizes using ReportLab.
 
@@ -34,12 +59,29 @@ class PageBuilder:
         # Variables
         self.config = config
         self.output_file_path = self.config.io.output_file_path
+        self.page_width = self.config.page.width * mm
         self.page_height = WORKING_PAGE_HEIGHT_MM * mm
         self.max_line_width = (
-            self.config.page.width * mm
+            self.page_width
             - self.config.document_margins.left
             - self.config.document_margins.right
         )
+        self._stroke_color: Tuple[float, float, float] | None = None
+        self._font: tuple[str, int] | None = None
+        self._buffer = io.BytesIO()
+
+        # Defaults used whenever a drawing call does not override them.
+        default_typography = self.config.typography.default
+        self._default_font_name = default_typography.font_name
+        self._default_font_size = default_typography.font_size
+        self._default_line_height_factor = default_typography.line_height_factor
+        self._default_font_shift_factor = default_typography.font_shift_factor
+        self._default_margin_top = self.config.section_margins.top
+        self._default_margin_bottom = self.config.section_margins.bottom
+        self._text_block_cache: OrderedDict[
+            tuple[str, str, int, float], tuple[list[str], float]
+        ] = OrderedDict()
+        self._word_width_cache: OrderedDict[tuple[str, int, str], float] = OrderedDict()
 
         # Actions
         ensure_directory(self.output_file_path)
@@ -51,18 +93,25 @@ class PageBuilder:
     ) -> canvas.Canvas:
         """Initialize a ReportLab canvas with the configured page size.
 
+        The canvas renders into an in-memory buffer; :meth:`save` writes the
+        finished document to the output file in one go.
+
         Returns:
             canvas.Canvas: A ReportLab canvas object.
         """
 
-        page_size = (self.config.page.width * mm, self.page_height)
-        return canvas.Canvas(self.output_file_path, pagesize=page_size)
+        page_size = (self.page_width, self.page_height)
+        return canvas.Canvas(self._buffer, pagesize=page_size)
 
     def _set_font(
         self, font_name: str | None = None, font_size: int | None = None
     ) -> None:
         """Set the active font for the canvas.
 
+        The canvas is only told to switch fonts when the requested font differs
+        from the active one, since every switch writes a font operator to the
+        page content.
+
         Args:
             font_name (str | None): Optional font name override. Falls back to
                 the configured font name when omitted.
@@ -70,10 +119,12 @@ class PageBuilder:
                 the configured font size when omitted.
         """
 
-        font_name = font_name or self.config.typography.default.font_name
-        font_size = font_size or self.config.typography.default.font_size
+        font_name = font_name or self._default_font_name
+        font_size = font_size or self._default_font_size
 
-        self.canvas.setFont(font_name, font_size)
+        if (font_name, font_size) != self._font:
+            self.canvas.setFont(font_name, font_size)
+            self._font = (font_name, font_size)
 
     def draw_horizontal_line(
         self, y: float, line_color: Tuple[float, float, float] | None = None
@@ -88,8 +139,11 @@ class PageBuilder:
 
         line_color = line_color or self.config.colors.line_color
 
-        self.canvas.setStrokeColorRGB(*line_color)
-        self.canvas.line(0, y, self.config.page.width * mm, y)
+        if line_color != self._stroke_color:
+            self.canvas.setStrokeColorRGB(*line_color)
+            self._stroke_color = line_color
+
+        self.canvas.line(0, y, self.page_width, y)
 
     def draw_image(self, image_path: str | None, y_pos: float) -> float:
         """Draw a cover image centered on the page with a fixed height.
@@ -117,7 +171,7 @@ class PageBuilder:
             self.canvas.rect(
                 x=0,
                 y=y_section_divider,
-                width=self.config.page.width * mm,
+                width=self.page_width,
                 height=image_height,
                 stroke=0,
                 fill=1,
@@ -127,12 +181,11 @@ class PageBuilder:
             self.draw_horizontal_line(y=y_section_divider)
             return y_section_divider
 
-        image = ImageReader(image_path)
-        initial_image_width, initial_image_height = image.getSize()
+        initial_image_width, initial_image_height = _image_size(image_path)
 
         image_scaling_factor = image_height / initial_image_height
         image_width = initial_image_width * image_scaling_factor
-        x_image = (self.config.page.width * mm - image_width) / 2
+        x_image = (self.page_width - image_width) / 2
         y_image = y_pos - image_height
 
         self.canvas.drawImage(image_path, x_image, y_image, image_width, image_height)
@@ -150,6 +203,10 @@ class PageBuilder:
     ) -> tuple[list[str], float]:
         """Measure how the text will wrap and its total height.
 
+        Results are kept in a least-recently-used cache keyed on text, font,
+        font size, and line width, so text that is measured again is only
+        wrapped once while the cache stays bounded.
+
         Args:
             text (str): Text to measure.
             font_name (str | None): Optional font override.
@@ -161,40 +218,260 @@ class PageBuilder:
                 text height in points.
         """
 
-        font_name = font_name or self.config.typography.default.font_name
-        font_size = font_size or self.config.typography.default.font_size
+        font_name = font_name or self._default_font_name
+        font_size = font_size or self._default_font_size
         max_line_width = max_line_width or self.max_line_width
 
-        line_height = font_size * self.config.typography.default.line_height_factor
+        cache_key = (text, font_name, font_size, max_line_width)
+        cached_block = self._text_block_cache.get(cache_key)
+        if cached_block is not None:
+            self._text_block_cache.move_to_end(cache_key)
+            return cached_block
 
-        self.canvas.setFont(font_name, font_size)
+        line_height = font_size * self._default_line_height_factor
 
         if "\n" in text:
-            words = text.splitlines(keepends=True)
-            words[-1] += "\n"
+            lines = self._wrap_line_breaks(
+                text=text,
+                font_name=font_name,
+                font_size=font_size,
+                max_line_width=max_line_width,
+            )
         else:
-            words = text.split()
+            lines = self.layout_text(
+                prepared=self.prepare_text(
+                    text=text, font_name=font_name, font_size=font_size
+                ),
+                max_line_width=max_line_width,
+            )
+
+        text_height = len(lines) * line_height
+        self._text_block_cache[cache_key] = (lines, text_height)
+        if len(self._text_block_cache) > TEXT_BLOCK_CACHE_SIZE:
+            self._text_block_cache.popitem(last=False)
+
+        return lines, text_height
+
+    def _word_width(self, word: str, font_name: str, font_size: int) -> float:
+        """Return the width of a single word, using a least-recently-used cache.
+
+        Recipes repeat many short words (articles, units, quantities), so
+        caching their widths avoids most ``stringWidth`` calls while wrapping.
+        Widths come from the font metrics directly, so measuring never needs
+        the document canvas.
+
+        Args:
+            word (str): Word to measure.
+            font_name (str): Font used for measuring.
+            font_size (int): Font size used for measuring.
+
+        Returns:
+            float: The width of the word, in points.
+        """
+
+        cache_key = (font_name, font_size, word)
+        width = self._word_width_cache.get(cache_key)
+        if width is not None:
+            self._word_width_cache.move_to_end(cache_key)
+            return width
+
+        width = stringWidth(word, font_name, font_size)
+        self._word_width_cache[cache_key] = width
+        if len(self._word_width_cache) > WORD_WIDTH_CACHE_SIZE:
+            self._word_width_cache.popitem(last=False)
+
+        return width
+
+    def prepare_text(self, text: str, font_name: str, font_size: int) -> PreparedText:
+        """Split text into words and measure every word once.
+
+        The result can be wrapped at any line width with :meth:`layout_text`
+        without measuring the text again.
+
+        Args:
+            text (str): Text to prepare. Any run of whitespace separates words.
+            font_name (str): Font used for measuring.
+            font_size (int): Font size used for measuring.
+
+        Returns:
+            PreparedText: The words of the text together with their widths.
+        """
+
+        measure_word = self._word_width
+        words = text.split()
+        widths = [measure_word(word, font_name, font_size) for word in words]
+        space_width = measure_word(" ", font_name, font_size)
+
+        # Accumulate in the same order as layout_text so a text whose total
+        # width fits is guaranteed to lay out as a single line.
+        total_width = widths[0] if widths else 0.0
+        for width in widths[1:]:
+            total_width = total_width + space_width + width
+
+        return PreparedText(
+            words=words,
+            widths=widths,
+            space_width=space_width,
+            total_width=total_width,
+            font_name=font_name,
+            font_size=font_size,
+        )
+
+    def layout_text(self, prepared: PreparedText, max_line_width: float) -> list[str]:
+        """Greedily wrap prepared text into lines that fit within a width.
+
+        The width of the line being built is kept as a running sum of the
+        prepared word widths, and a line's string is only joined once it is
+        complete. Words that are wider than a whole line on their own (long
+        URLs, identifiers) are broken between characters with
+        :meth:`_split_long_word`.
+
+        Args:
+            prepared (PreparedText): Text prepared by :meth:`prepare_text`.
+            max_line_width (float): Maximum width of a line, in points.
+
+        Returns:
+            list[str]: The wrapped lines of text.
+        """
+
+        words = prepared.words
+        if not words:
+            return []
+
+        # Most titles, ingredients and short steps fit on one line.
+        if prepared.total_width <= max_line_width:
+            return [" ".join(words)]
+
+        space_width = prepared.space_width
+
+        current_words: list[str] = []
+        current_width = 0.0
+        lines = []
+
+        for word, word_width in zip(words, prepared.widths):
+            line_width = (
+                current_width + space_width + word_width
+                if current_words
+                else word_width
+            )
+
+            if word_width > max_line_width:
+                if current_words:
+                    lines.append(" ".join(current_words))
+                *full_pieces, last_piece = self._split_long_word(
+                    word, prepared.font_name, prepared.font_size, max_line_width
+                )
+                lines.extend(full_pieces)
+                current_words = [last_piece]
+                current_width = self._word_width(
+                    last_piece, prepared.font_name, prepared.font_size
+                )
+            elif line_width > max_line_width:
+                lines.append(" ".join(current_words))
+                current_words = [word]
+                current_width = word_width
+            else:
+                current_words.append(word)
+                current_width = line_width
+
+        if current_words:
+            lines.append(" ".join(current_words))
+
+        return lines
+
+    def _split_long_word(
+        self, word: str, font_name: str, font_size: int, max_line_width: float
+    ) -> list[str]:
+        """Break a word that is too wide for a line into fitting pieces.
+
+        The break point of each piece is found by binary search over the prefix
+        widths, which grow monotonically with the prefix length, so a piece of
+        ``n`` characters costs about ``log2(n)`` width measurements instead of
+        one per character. Every piece holds at least one character, even when
+        a single character does not fit.
+
+        Args:
+            word (str): The word to break.
+            font_name (str): Font name used to measure the word.
+            font_size (int): Font size used to measure the word.
+            max_line_width (float): Maximum width of a piece, in points.
+
+        Returns:
+            list[str]: The pieces of the word, in order.
+        """
+
+        pieces = []
+        remaining = word
+        while remaining:
+            low, high = 1, len(remaining)
+            while low < high:
+                middle = (low + high + 1) // 2
+                prefix_width = stringWidth(remaining[:middle], font_name, font_size)
+                if prefix_width <= max_line_width:
+                    low = middle
+                else:
+                    high = middle - 1
+
+            pieces.append(remaining[:low])
+            remaining = remaining[low:]
+
+        return pieces
+
+    def _wrap_line_breaks(
+        self,
+        text: str,
+        font_name: str,
+        font_size: int,
+        max_line_width: float,
+    ) -> list[str]:
+        """Split text containing explicit line breaks into lines.
+
+        Every newline character starts a new line. Other line boundaries that
+        :meth:`str.splitlines` recognizes (such as ``"\\r"``) are joined to the
+        previous line with a space when they fit, as spaces between words are.
+        A line that is too wide on its own is wrapped with :meth:`layout_text`,
+        which also breaks words that are wider than a whole line.
+
+        Args:
+            text (str): Text containing one or more newline characters.
+            font_name (str): Font used for measuring.
+            font_size (int): Font size used for measuring.
+            max_line_width (float): Maximum width of a line, in points.
+
+        Returns:
+            list[str]: The lines of text, without trailing newlines.
+        """
+
+        words = text.splitlines(keepends=True)
+        words[-1] += "\n"
 
         current_line = ""
         lines = []
 
         for word in words:
+            if stringWidth(word.strip(), font_name, font_size) > max_line_width:
+                if current_line:
+                    lines.append(current_line)
+                *full_lines, current_line = self.layout_text(
+                    prepared=self.prepare_text(word, font_name, font_size),
+                    max_line_width=max_line_width,
+                )
+                lines.extend(full_lines)
+                continue
+
             line = f"{current_line} {word}".strip()
-            line_width = self.canvas.stringWidth(line, font_name, font_size)
+            line_width = stringWidth(line, font_name, font_size)
 
             if line_width > max_line_width or "\n" in word and current_line != "":
                 lines.append(current_line)
                 current_line = word
-            elif line_width <= max_line_width:
+            else:
                 current_line = line
 
         if current_line:
             lines.append(current_line)
 
-        lines = [line.rstrip("\n") for line in lines]
-
-        text_height = len(lines) * line_height
-        return lines, text_height
+        return [line.rstrip("\n") for line in lines]
 
     def draw_text_block(
         self,
@@ -235,22 +512,18 @@ class PageBuilder:
         """
 
         max_line_width = max_line_width or self.max_line_width
-        font_name = font_name or self.config.typography.default.font_name
-        font_size = font_size or self.config.typography.default.font_size
-        line_height_factor = (
-            line_height_factor or self.config.typography.default.line_height_factor
-        )
-        margin_top = margin_top or self.config.section_margins.top
-        margin_bottom = margin_bottom or self.config.section_margins.bottom
-        font_shift_factor = (
-            font_shift_factor or self.config.typography.default.font_shift_factor
-        )
+        font_name = font_name or self._default_font_name
+        font_size = font_size or self._default_font_size
+        line_height_factor = line_height_factor or self._default_line_height_factor
+        margin_top = margin_top or self._default_margin_top
+        margin_bottom = margin_bottom or self._default_margin_bottom
+        font_shift_factor = font_shift_factor or self._default_font_shift_factor
 
         if isinstance(text, list):
             text = "\n".join(text)
 
         line_height = font_size * line_height_factor
-        self.canvas.setFont(font_name, font_size)
+        self._set_font(font_name, font_size)
 
         font_spacing_correction = font_shift_factor * font_size
         y_position = y - font_spacing_correction
@@ -264,27 +537,25 @@ class PageBuilder:
         block_height = (
             text_height + margin_top + margin_bottom + font_spacing_correction
         )
-        y_block = y_position - margin_top - text_height - margin_bottom
+        y_section_divider = y - block_height
 
         if background_color:
             self.canvas.setFillColorRGB(*background_color)
             self.canvas.rect(
                 x=0,
-                y=y_block,
-                width=self.config.page.width * mm,
+                y=y_section_divider,
+                width=self.page_width,
                 height=block_height,
                 stroke=0,
                 fill=1,
             )
             self.canvas.setFillColorRGB(0, 0, 0)
 
-        y_draw = y_position - margin_top
-
+        text_object = self.canvas.beginText(x, y_position - margin_top)
+        text_object.setLeading(line_height)
         for line in lines:
-            self.canvas.drawString(x, y_draw, line)
-            y_draw -= line_height
-
-        y_section_divider = y - block_height
+            text_object.textLine(line)
+        self.canvas.drawText(text_object)
 
         self.draw_horizontal_line(y=y_section_divider)
 
@@ -329,43 +600,39 @@ class PageBuilder:
                 in points.
         """
 
-        font_name = font_name or self.config.typography.default.font_name
-        font_size = font_size or self.config.typography.default.font_size
-        line_height_factor = (
-            line_height_factor or self.config.typography.default.line_height_factor
-        )
-        margin_top = margin_top or self.config.section_margins.top
-        margin_bottom = margin_bottom or self.config.section_margins.bottom
-        font_shift_factor = (
-            font_shift_factor or self.config.typography.default.font_shift_factor
-        )
-
-        self.canvas.setFont(font_name, font_size)
+        font_name = font_name or self._default_font_name
+        font_size = font_size or self._default_font_size
+        line_height_factor = line_height_factor or self._default_line_height_factor
+        margin_top = margin_top or self._default_margin_top
+        margin_bottom = margin_bottom or self._default_margin_bottom
+        font_shift_factor = font_shift_factor or self._default_font_shift_factor
 
         font_spacing_correction = font_shift_factor * font_size
         y_position = y - font_spacing_correction
 
-        wrapped_segments: list[tuple[float, float, list[str], str, int, float]] = []
+        measure_text_block = self._measure_text_block
+        max_line_width = self.max_line_width
+        wrapped_segments: list[WrappedSegment] = []
         content_height = 0.0
 
         for segment in segments:
             segment_font_name = segment.font_name or font_name
             segment_font_size = segment.font_size or font_size
             segment_line_height = segment_font_size * line_height_factor
-            lines, _ = self._measure_text_block(
+            lines, _ = measure_text_block(
                 text=segment.text,
                 font_name=segment_font_name,
                 font_size=segment_font_size,
-                max_line_width=self.max_line_width - segment.indent,
+                max_line_width=max_line_width - segment.indent,
             )
             wrapped_segments.append(
-                (
-                    segment.indent,
-                    segment.space_before,
-                    lines,
-                    segment_font_name,
-                    segment_font_size,
-                    segment_line_height,
+                WrappedSegment(
+                    lines=lines,
+                    indent=segment.indent,
+                    space_before=segment.space_before,
+                    font_name=segment_font_name,
+                    font_size=segment_font_size,
+                    line_height=segment_line_height,
                 )
             )
             content_height += segment.space_before + len(lines) * segment_line_height
@@ -373,37 +640,46 @@ class PageBuilder:
         block_height = (
             content_height + margin_top + margin_bottom + font_spacing_correction
         )
-        y_block = y_position - margin_top - content_height - margin_bottom
+        y_section_divider = y - block_height
 
         if background_color:
             self.canvas.setFillColorRGB(*background_color)
             self.canvas.rect(
                 x=0,
-                y=y_block,
-                width=self.config.page.width * mm,
+                y=y_section_divider,
+                width=self.page_width,
                 height=block_height,
                 stroke=0,
                 fill=1,
             )
             self.canvas.setFillColorRGB(0, 0, 0)
 
+        # All segments share one text object, so the whole block is emitted as
+        # a single BT/ET pair with font changes only where segments need them.
+        text_object = self.canvas.beginText()
+        text_line = text_object.textLine
         y_draw = y_position - margin_top
 
-        for (
-            indent,
-            space_before,
-            lines,
-            segment_font_name,
-            segment_font_size,
-            segment_line_height,
-        ) in wrapped_segments:
-            y_draw -= space_before
-            self.canvas.setFont(segment_font_name, segment_font_size)
-            for line in lines:
-                self.canvas.drawString(x + indent, y_draw, line)
-                y_draw -= segment_line_height
+        for wrapped_segment in wrapped_segments:
+            y_draw -= wrapped_segment.space_before
+            text_object.setTextOrigin(x + wrapped_segment.indent, y_draw)
+            text_object.setFont(
+                wrapped_segment.font_name,
+                wrapped_segment.font_size,
+                leading=wrapped_segment.line_height,
+            )
+            for line in wrapped_segment.lines:
+                text_line(line)
+            y_draw -= len(wrapped_segment.lines) * wrapped_segment.line_height
 
-        y_section_divider = y - block_height
+        self.canvas.drawText(text_object)
+
+        # Font changes inside a text object are not tracked by the canvas, so
+        # hand the canvas the font that is active after the block.
+        if wrapped_segments:
+            last_segment = wrapped_segments[-1]
+            self._font = None
+            self._set_font(last_segment.font_name, last_segment.font_size)
 
         self.draw_horizontal_line(y=y_section_divider)
 
@@ -420,9 +696,7 @@ class PageBuilder:
         """
 
         self.canvas.setFillColorRGB(*color)
-        self.canvas.rect(
-            0, 0, self.config.page.width * mm, self.page_height, stroke=0, fill=1
-        )
+        self.canvas.rect(0, 0, self.page_width, self.page_height, stroke=0, fill=1)
         self.canvas.setFillColorRGB(0, 0, 0)
 
     def draw_inline_link_right(
@@ -447,13 +721,9 @@ class PageBuilder:
             font_size (int): Font size in points.
         """
 
-        self.canvas.setFont(font_name, font_size)
-        text_width = self.canvas.stringWidth(text, font_name, font_size)
-        x = (
-            self.config.page.width * mm
-            - self.config.document_margins.right
-            - text_width
-        )
+        self._set_font(font_name, font_size)
+        text_width = stringWidth(text, font_name, font_size)
+        x = self.page_width - self.config.document_margins.right - text_width
         self.canvas.drawString(x, y, text)
         underline_y = y - font_size * 0.12
         self.canvas.line(x, underline_y, x + text_width, underline_y)
@@ -504,15 +774,18 @@ class PageBuilder:
         """
 
         lines, _ = self._measure_text_block(text, font_name, font_size)
-        line_height = font_size * self.config.typography.default.line_height_factor
+        line_height = font_size * self._default_line_height_factor
 
-        self.canvas.setFont(font_name, font_size)
+        pdf_canvas = self.canvas
+        underline_offset = font_size * 0.12
+
+        self._set_font(font_name, font_size)
         y_draw = y
         for line in lines:
-            self.canvas.drawString(x, y_draw, line)
-            line_width = self.canvas.stringWidth(line, font_name, font_size)
-            underline_y = y_draw - font_size * 0.12
-            self.canvas.line(x, underline_y, x + line_width, underline_y)
+            pdf_canvas.drawString(x, y_draw, line)
+            line_width = stringWidth(line, font_name, font_size)
+            underline_y = y_draw - underline_offset
+            pdf_canvas.line(x, underline_y, x + line_width, underline_y)
             y_draw -= line_height
 
         # One invisible link rect covering all lines.
@@ -542,27 +815,36 @@ class PageBuilder:
 
         if content_bottom_ys is not None:
             self._crop_bottom_whitespace(content_bottom_ys=content_bottom_ys)
+        else:
+            with open(self.output_file_path, "wb") as f:
+                f.write(self._buffer.getvalue())
 
     def new_page(self) -> None:
         """Finalize the current page and start a fresh one.
 
         Resets the active font so subsequent drawing on the new page uses the
-        configured default.
+        configured default, and forgets the stroke color because ReportLab
+        resets the graphics state on every new page.
         """
 
         self.canvas.showPage()
+        self._stroke_color = None
+        self._font = None
         self._set_font()
 
     def _crop_bottom_whitespace(self, content_bottom_ys: list[float]) -> None:
         """Crop the empty space below the content on each page.
 
+        Reads the rendered document from the in-memory buffer and writes the
+        cropped result to the output file.
+
         Args:
             content_bottom_ys (list[float]): Vertical position of the bottom of
                 the drawn content for each page, in points, ordered by page.
                 Everything below each position is removed from that page.
         """
 
-        reader = PdfReader(self.output_file_path)
+        reader = PdfReader(self._buffer)
         writer = PdfWriter()
 
         for page, content_bottom_y in zip(reader.pages, content_bottom_ys):
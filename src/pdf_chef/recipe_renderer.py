@@ -1,7 +1,8 @@
 """Module for rendering a single recipe's sections onto a page."""
 
+from itertools import cycle
 from pathlib import Path
-from typing import Tuple, cast
+from typing import Any, Callable, Iterator, Tuple, cast
 
 from pdf_chef.page_builder import PageBuilder
 from pdf_chef.text_segment import TextSegment
@@ -29,8 +30,20 @@ class RecipeRenderer:
         self.config = config
         self.page = page
         self.y_position: float = self.page.page_height
-        self.section_counter: int = 0
         self.background_color_palette: list[Tuple[float, float, float]] = []
+        self._background_colors: Iterator[Tuple[float, float, float]] = iter(())
+
+        # Layout values used for every block, resolved once per renderer.
+        self._text_x: float = self.config.document_margins.left
+        self._back_link_baseline_offset: float = (
+            self.config.back_link.bottom_margin + self.config.back_link.font.font_size
+        )
+        self._section_handlers: dict[str, Callable[[Any], None]] = {
+            "title": self._draw_title_with_back_link,
+            "description": self._draw_description,
+            "ingredients": self._draw_ingredients,
+            "instructions": self._draw_instructions,
+        }
 
     def render(self, recipe: dict) -> float:
         """Render a single recipe onto the current page.
@@ -47,15 +60,15 @@ class RecipeRenderer:
         """
 
         self.y_position = self.page.page_height
-        self.section_counter = 0
         self.background_color_palette = [
             cast(Tuple[float, float, float], normalize_rgb(color))
             for color in recipe["colors"]["background_color_palette"]
         ]
+        self._background_colors = cycle(self.background_color_palette)
 
         self._draw_cover_image(image_path=recipe.get("cover_image"))
 
-        for section_name in recipe.keys():
+        for section_name in recipe:
             if section_name == "cover_image":
                 continue
             self.add_section(recipe=recipe, section_name=section_name)
@@ -88,9 +101,8 @@ class RecipeRenderer:
     ) -> None:
         """Draw a styled text block with background and a horizontal divider.
 
-        The background color is selected from the configured palette by cycling
-        through it based on the current section counter, which is incremented
-        after the block is drawn.
+        The background color is the next color from the recipe's cycling
+        background palette.
 
         Args:
             text (str): Text content to draw.
@@ -98,21 +110,17 @@ class RecipeRenderer:
             font_size (int | None): Optional font size override.
         """
 
-        background_color = self.background_color_palette[
-            self.section_counter % len(self.background_color_palette)
-        ]
+        background_color = next(self._background_colors)
 
         self.y_position = self.page.draw_text_block(
             text=text,
-            x=self.config.document_margins.left,
+            x=self._text_x,
             y=self.y_position,
             background_color=background_color,
             font_name=font_name,
             font_size=font_size,
         )
 
-        self.section_counter += 1
-
     def _draw_structured_block(
         self,
         segments: list[TextSegment],
@@ -127,21 +135,17 @@ class RecipeRenderer:
             font_size (int | None): Optional font size override.
         """
 
-        background_color = self.background_color_palette[
-            self.section_counter % len(self.background_color_palette)
-        ]
+        background_color = next(self._background_colors)
 
         self.y_position = self.page.draw_structured_block(
             segments=segments,
-            x=self.config.document_margins.left,
+            x=self._text_x,
             y=self.y_position,
             background_color=background_color,
             font_name=font_name,
             font_size=font_size,
         )
 
-        self.section_counter += 1
-
     def _draw_instructions(self, instructions: list[dict]) -> None:
         """Draw the recipe instructions as a single uniform section.
 
@@ -158,33 +162,37 @@ class RecipeRenderer:
                 where every step has a ``step_number`` and ``text``.
         """
 
+        typography = self.config.typography.instructions
+        header_font_name = typography.header.font_name
+        header_font_size = typography.header.font_size
+        step_font_name = typography.step.font_name
+        step_font_size = typography.step.font_size
+
         segments: list[TextSegment] = []
 
         for index, section in enumerate(instructions):
-            section_number = section["section_number"]
+            section_prefix = f"{section['section_number']}."
             segments.append(
                 TextSegment(
-                    text=f"{section_number}. {section['section']}",
-                    space_before=0.0
-                    if index == 0
-                    else self.config.typography.instructions.section_spacing,
-                    font_name=self.config.typography.instructions.header.font_name,
-                    font_size=self.config.typography.instructions.header.font_size,
+                    text=f"{section_prefix} {section['section']}",
+                    space_before=0.0 if index == 0 else typography.section_spacing,
+                    font_name=header_font_name,
+                    font_size=header_font_size,
                 )
             )
 
             for step_index, step in enumerate(section["steps"]):
                 segments.append(
                     TextSegment(
-                        text=f"{section_number}.{step['step_number']} {step['text']}",
-                        indent=self.config.typography.instructions.step_indent,
+                        text=f"{section_prefix}{step['step_number']} {step['text']}",
+                        indent=typography.step_indent,
                         space_before=(
-                            self.config.typography.instructions.section_header_bottom_spacing
+                            typography.section_header_bottom_spacing
                             if step_index == 0
                             else 0.0
                         ),
-                        font_name=self.config.typography.instructions.step.font_name,
-                        font_size=self.config.typography.instructions.step.font_size,
+                        font_name=step_font_name,
+                        font_size=step_font_size,
                     )
                 )
 
@@ -201,32 +209,37 @@ class RecipeRenderer:
                 ``category`` name and a list of ``items``.
         """
 
+        typography = self.config.typography.ingredients
+        bullet = typography.bullet
+        category_font_name = typography.category.font_name
+        category_font_size = typography.category.font_size
+        item_font_name = typography.item.font_name
+        item_font_size = typography.item.font_size
+
         segments: list[TextSegment] = []
 
         for index, category in enumerate(ingredients):
             segments.append(
                 TextSegment(
                     text=category["category"],
-                    space_before=0.0
-                    if index == 0
-                    else self.config.typography.ingredients.section_spacing,
-                    font_name=self.config.typography.ingredients.category.font_name,
-                    font_size=self.config.typography.ingredients.category.font_size,
+                    space_before=0.0 if index == 0 else typography.section_spacing,
+                    font_name=category_font_name,
+                    font_size=category_font_size,
                 )
             )
 
             for item_index, item in enumerate(category["items"]):
                 segments.append(
                     TextSegment(
-                        text=f"{self.config.typography.ingredients.bullet}{item}",
-                        indent=self.config.typography.ingredients.item_indent,
+                        text=bullet + item,
+                        indent=typography.item_indent,
                         space_before=(
-                            self.config.typography.ingredients.section_header_bottom_spacing
+                            typography.section_header_bottom_spacing
                             if item_index == 0
                             else 0.0
                         ),
-                        font_name=self.config.typography.ingredients.item.font_name,
-                        font_size=self.config.typography.ingredients.item.font_size,
+                        font_name=item_font_name,
+                        font_size=item_font_size,
                     )
                 )
 
@@ -247,6 +260,19 @@ class RecipeRenderer:
         )
         self._draw_back_link(title_block_bottom=self.y_position)
 
+    def _draw_description(self, description: str) -> None:
+        """Draw the recipe description block.
+
+        Args:
+            description (str): The recipe description text to render.
+        """
+
+        self._draw_text_block(
+            text=description,
+            font_size=self.config.typography.description.font_size,
+            font_name=self.config.typography.description.font_name,
+        )
+
     def _draw_back_link(self, title_block_bottom: float) -> None:
         """Draw the back-to-overview link in the lower-right of the title block.
 
@@ -258,9 +284,7 @@ class RecipeRenderer:
         self.page.draw_inline_link_right(
             text=self.config.back_link.text,
             destination="toc",
-            y=title_block_bottom
-            + self.config.back_link.bottom_margin
-            + self.config.back_link.font.font_size,
+            y=title_block_bottom + self._back_link_baseline_offset,
             font_name=self.config.back_link.font.font_name,
             font_size=self.config.back_link.font.font_size,
         )
@@ -268,23 +292,15 @@ class RecipeRenderer:
     def add_section(self, recipe: dict, section_name: str) -> None:
         """Add a recipe section by name using a dispatch table.
 
+        The dispatch table is built once in ``__init__`` and maps each known
+        section name to the bound method that draws it.
+
         Args:
             recipe (dict): The recipe whose section should be rendered.
             section_name (str): Name of the recipe section to render. Only known
                 section names are drawn; unknown names are ignored.
         """
 
-        section_handlers = {
-            "title": lambda value: self._draw_title_with_back_link(value),
-            "description": lambda value: self._draw_text_block(
-                text=value,
-                font_size=self.config.typography.description.font_size,
-                font_name=self.config.typography.description.font_name,
-            ),
-            "ingredients": lambda value: self._draw_ingredients(ingredients=value),
-            "instructions": lambda value: self._draw_instructions(instructions=value),
-        }
-
-        if section_name in section_handlers:
-            handler = section_handlers[section_name]
+        handler = self._section_handlers.get(section_name)
+        if handler is not None:
             handler(recipe[section_name])
@@ -21,3 +21,51 @@ class TextSegment:
     space_before: float = 0.0
     font_name: str | None = None
     font_size: int | None = None
+
+
+@dataclass(slots=True)
+class WrappedSegment:
+    """A text segment after wrapping, ready to be drawn.
+
+    Attributes:
+        lines (list[str]): The wrapped lines of the segment.
+        indent (float): Horizontal indentation of the segment, in points.
+        space_before (float): Extra vertical space above the segment, in points.
+        font_name (str): Resolved font name of the segment.
+        font_size (int): Resolved font size of the segment.
+        line_height (float): Vertical distance between the segment's lines, in
+            points.
+    """
+
+    lines: list[str]
+    indent: float
+    space_before: float
+    font_name: str
+    font_size: int
+    line_height: float
+
+
+@dataclass(slots=True)
+class PreparedText:
+    """Text split into words with every word measured for one font.
+
+    Produced by :meth:`PageBuilder.prepare_text` and consumed by
+    :meth:`PageBuilder.layout_text`, which can wrap the same prepared text at
+    any line width without measuring it again.
+
+    Attributes:
+        words (list[str]): The whitespace-separated words of the text.
+        widths (list[float]): Width of each word, in points.
+        space_width (float): Width of a single space, in points.
+        total_width (float): Width of all words joined by single spaces, in
+            points.
+        font_name (str): Font used for measuring.
+        font_size (int): Font size used for measuring.
+    """
+
+    words: list[str]
+    widths: list[float]
+    space_width: float
+    total_width: float
+    font_name: str
+    font_size: int
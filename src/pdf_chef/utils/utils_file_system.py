@@ -1,30 +1,66 @@
 """Module with file-system utility functions."""
 
-import json
 import os
 
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson as _json_backend
+except ImportError:
+    import json as _json_backend
+
+# Absolute paths of directories already created (or found) by ensure_directory.
+_CREATED_DIRECTORIES: set[str] = set()
+
 
 def load_json_file(file_path: str | Path) -> dict:
     """Load a JSON file and return its contents as a dictionary.
 
+    Parsed files are cached per path and modification time, so loading an
+    unchanged file again returns the same dictionary without re-parsing it.
+    The returned dictionary is shared between callers and must not be
+    mutated.
+
     Args:
         file_path (str | Path): Path to the JSON file to load.
 
     Returns:
         dict: The parsed contents of the JSON file.
     """
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return _load_json_file_cached(os.fspath(file_path), os.stat(file_path).st_mtime)
+
+
+@lru_cache(maxsize=128)
+def _load_json_file_cached(file_path: str, mtime: float) -> dict:
+    """Parse a JSON file, cached on its path and modification time.
+
+    Args:
+        file_path (str): Path to the JSON file to load.
+        mtime (float): Modification time of the file; only used as part of the
+            cache key so edited files are parsed again.
+
+    Returns:
+        dict: The parsed contents of the JSON file.
+    """
+    with open(file_path, "rb") as f:
+        return _json_backend.loads(f.read())
 
 
 def ensure_directory(file_path: str | Path) -> None:
     """Create the parent dictionary of a file path if it does not exist.
 
+    Directories are remembered once they exist, so later calls for the same
+    directory return without touching the file system. A directory removed
+    during the run is therefore not recreated.
+
     Args:
         file_path (str | Path): Path to a file whose parent directory should
             exist.
     """
-    directory_path = Path(file_path).parent
+    directory_path = os.path.abspath(Path(file_path).parent)
+    if directory_path in _CREATED_DIRECTORIES:
+        return
+
     os.makedirs(directory_path, exist_ok=True)
+    _CREATED_DIRECTORIES.add(directory_path)